@@ -0,0 +1,48 @@
+"""
+Tests for the data source connectors.
+"""
+
+import pytest
+
+# The connectors package pulls in the HTTP-backed connectors at the top,
+# so importing it requires their optional dependencies
+_local_files = pytest.importorskip("wara9a.connectors.local_files")
+LocalFilesConnector = _local_files.LocalFilesConnector
+
+
+class TestChangelogParsing:
+    """Tests for CHANGELOG parsing in the local files connector."""
+
+    def setup_method(self):
+        self.connector = LocalFilesConnector()
+
+    def test_parses_versions_dates_and_descriptions(self):
+        releases = self.connector._parse_changelog_content(
+            "# Changelog\n"
+            "\n"
+            "## [2.0.0] - 2024-03-01\n"
+            "\n"
+            "- Breaking change\n"
+            "- New API\n"
+            "\n"
+            "## [1.0.0] - 2023-01-01\n"
+            "\n"
+            "- Initial release\n"
+        )
+
+        assert [r.tag for r in releases] == ["v2.0.0", "v1.0.0"]
+        assert "Breaking change" in releases[0].description
+        assert "New API" in releases[0].description
+        assert releases[1].description == "- Initial release"
+        assert releases[1].published_at.year == 2023
+
+    def test_detects_prerelease_versions(self):
+        releases = self.connector._parse_changelog_content(
+            "## [1.0.0-rc1] - 2023-06-01\n\n- Release candidate\n"
+        )
+
+        assert len(releases) == 1
+        assert releases[0].is_prerelease
+
+    def test_empty_changelog_yields_no_releases(self):
+        assert self.connector._parse_changelog_content("# Changelog\n") == []
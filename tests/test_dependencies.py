@@ -120,6 +120,21 @@ class TestDependencyManager:
         assert result is False
         mock_run.assert_called_once()
     
+    def test_readonly_environment_skips_install(self):
+        """Test that a read-only environment short-circuits installation."""
+        config = create_default_config("Test Project")
+        config.sources = [GitHubSourceConfig(repo="test/repo")]
+
+        manager = DependencyManager(auto_install=True, dry_run=False)
+
+        with patch.object(manager, '_check_import', return_value=False), \
+             patch.object(manager, '_is_environment_writable', return_value=False), \
+             patch.object(manager, '_install_packages') as mock_install:
+            result = manager.auto_install_dependencies(config)
+
+            assert result is False
+            mock_install.assert_not_called()
+
     def test_dry_run_mode(self):
         """Test mode simulation."""
         config = create_default_config("Test Project")
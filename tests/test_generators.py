@@ -0,0 +1,76 @@
+"""
+Tests for the output generators.
+"""
+
+import time
+
+import pytest
+
+from wara9a.generators.html import HTMLGenerator, _convert_inline
+
+
+class TestFallbackConverter:
+    """Tests for the regex-free fallback Markdown converter."""
+
+    def setup_method(self):
+        self.generator = HTMLGenerator()
+
+    def test_basic_elements(self):
+        html = self.generator._simple_markdown_to_html(
+            "# Title\n- item **bold**\n\npara with [link](http://x) and `code`"
+        )
+
+        assert "<h1>Title</h1>" in html
+        assert "<li>item <strong>bold</strong></li>" in html
+        assert '<a href="http://x">link</a>' in html
+        assert "<code>code</code>" in html
+
+    def test_unmatched_markers_stay_verbatim(self):
+        html = self.generator._simple_markdown_to_html("lonely *star and `tick")
+
+        assert "<em>" not in html
+        assert "<code>" not in html
+        assert "*star" in html
+
+    def test_pathological_input_is_linear(self):
+        # The old regex alternation backtracked on marker-heavy input;
+        # the scanner must stay fast on adversarial documents
+        adversarial = "*" * 10000 + "b"
+
+        start = time.perf_counter()
+        _convert_inline(adversarial)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+
+    def test_pathological_nested_bold(self):
+        adversarial = "**" * 5000
+
+        start = time.perf_counter()
+        _convert_inline(adversarial)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+
+
+class TestHTMLTemplate:
+    """Tests for the HTML document assembly."""
+
+    def setup_method(self):
+        self.generator = HTMLGenerator()
+
+    def test_title_and_description_escaped(self):
+        html = self.generator._apply_html_template(
+            "<p>x</p>",
+            {"project": {"name": 'a<b>"q"', "description": "d & e"}},
+        )
+
+        assert "<title>a&lt;b&gt;&quot;q&quot;</title>" in html
+        assert 'content="d &amp; e"' in html
+
+    def test_content_wrapped_between_head_and_tail(self):
+        html = self.generator._apply_html_template("<p>body</p>", {"project": {}})
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<p>body</p>" in html
+        assert html.endswith("</html>")
@@ -0,0 +1,478 @@
+"""
+Tests for Wara9a data models.
+
+Covers the technical documentation models and their fast paths.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from wara9a.core.models import (
+    Author,
+    CodeChange,
+    ProjectData,
+    Release,
+    Repository,
+    SourceType,
+    TechnicalCommit,
+    TechnicalData,
+    TechnicalPullRequest,
+    validate_code_changes,
+)
+
+
+class TestTrustedFactories:
+    """Tests for the validation-free from_trusted constructors."""
+
+    def test_code_change_from_trusted(self):
+        """Test building a CodeChange from a trusted dict."""
+        change = CodeChange.from_trusted({
+            "file_path": "src/main.py",
+            "change_type": "modified",
+            "additions": 10,
+            "deletions": 2,
+        })
+
+        assert change.file_path == "src/main.py"
+        assert change.additions == 10
+        # Defaults are still applied for missing fields
+        assert change.changes == 0
+
+    def test_commit_from_trusted_nested(self):
+        """Test that nested author and file changes are constructed."""
+        commit = TechnicalCommit.from_trusted({
+            "sha": "abc123def456",
+            "short_sha": "abc123d",
+            "message": "feat: add feature",
+            "message_subject": "feat: add feature",
+            "author": {"name": "Jane Doe", "email": "jane@example.com"},
+            "date": datetime.now(timezone.utc),
+            "files_changed": [
+                {"file_path": "a.py", "change_type": "added", "additions": 5},
+            ],
+        })
+
+        assert isinstance(commit.author, Author)
+        assert commit.author.name == "Jane Doe"
+        assert isinstance(commit.files_changed[0], CodeChange)
+        assert commit.files_changed[0].additions == 5
+
+    def test_pull_request_from_trusted(self):
+        """Test building a TechnicalPullRequest from a trusted dict."""
+        pr = TechnicalPullRequest.from_trusted({
+            "id": "1",
+            "number": 42,
+            "title": "Add feature",
+            "author": {"name": "John Doe"},
+            "status": "merged",
+            "state": "closed",
+            "source_branch": "feature",
+            "target_branch": "main",
+            "created_at": datetime.now(timezone.utc),
+            "reviewers": [{"name": "Jane Doe"}],
+        })
+
+        assert pr.number == 42
+        assert isinstance(pr.author, Author)
+        assert isinstance(pr.reviewers[0], Author)
+
+
+def _make_commit(sha: str, author_name: str = "Jane Doe", additions: int = 0,
+                 deletions: int = 0) -> TechnicalCommit:
+    """Builds a minimal valid TechnicalCommit for tests."""
+    return TechnicalCommit(
+        sha=sha,
+        short_sha=sha[:7],
+        message=f"commit {sha}",
+        message_subject=f"commit {sha}",
+        author=Author(name=author_name),
+        date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        total_additions=additions,
+        total_deletions=deletions,
+    )
+
+
+class TestTechnicalDataAnalytics:
+    """Tests for TechnicalData aggregate helpers."""
+
+    def test_total_additions_and_deletions(self):
+        """Test line totals across commits."""
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=[
+                _make_commit("a" * 12, additions=10, deletions=2),
+                _make_commit("b" * 12, additions=5, deletions=1),
+            ],
+        )
+
+        assert data.get_total_additions() == 15
+        assert data.get_total_deletions() == 3
+
+    def test_get_commits_by_author(self):
+        """Test the author index returns the right commits."""
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=[
+                _make_commit("a" * 12, author_name="Jane Doe"),
+                _make_commit("b" * 12, author_name="John Doe"),
+                _make_commit("c" * 12, author_name="Jane Doe"),
+            ],
+        )
+
+        jane_commits = data.get_commits_by_author("Jane Doe")
+        assert len(jane_commits) == 2
+        assert data.get_commits_by_author("John Doe")[0].short_sha == "b" * 7
+        assert data.get_commits_by_author("Unknown") == []
+
+        # Index follows commit list growth
+        data.commits.append(_make_commit("d" * 12, author_name="Jane Doe"))
+        assert len(data.get_commits_by_author("Jane Doe")) == 3
+
+    def test_shared_diff_buffer(self):
+        """Test storing and resolving diffs through the shared buffer."""
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+        )
+
+        ref = data.store_diff("+added line\n-removed line\n")
+        change = CodeChange(file_path="a.py", change_type="modified", diff_ref=ref)
+
+        assert change.diff is None
+        assert change.get_diff(data) == "+added line\n-removed line\n"
+
+        # Inline diffs still take precedence
+        inline = CodeChange(file_path="b.py", change_type="added", diff="+x\n")
+        assert inline.get_diff(data) == "+x\n"
+
+    def test_get_merged_prs(self):
+        """Test the status-partitioned pull request lookup."""
+        def make_pr(number, status):
+            return TechnicalPullRequest(
+                id=str(number),
+                number=number,
+                title=f"PR {number}",
+                author=Author(name="Jane Doe"),
+                status=status,
+                state=status,
+                source_branch="feature",
+                target_branch="main",
+                created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            pull_requests=[make_pr(1, "merged"), make_pr(2, "open"), make_pr(3, "merged")],
+        )
+
+        merged = data.get_merged_prs()
+        assert [pr.number for pr in merged] == [1, 3]
+
+    def test_iter_commits_by_sha(self):
+        """Test PR commit resolution through the sha index."""
+        commits = [_make_commit("a" * 12), _make_commit("b" * 12)]
+        pr = TechnicalPullRequest(
+            id="1",
+            number=1,
+            title="PR",
+            author=Author(name="Jane Doe"),
+            status="merged",
+            state="closed",
+            source_branch="feature",
+            target_branch="main",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            commit_shas=["b" * 12, "unknown"],
+        )
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=commits,
+            pull_requests=[pr],
+        )
+
+        resolved = list(pr.iter_commits(data))
+        assert len(resolved) == 1
+        assert resolved[0] is data.get_commit_by_sha("b" * 12)
+
+    def test_get_commits_since_sorted(self):
+        """Test the binary-searched date range query on sorted commits."""
+        commits = []
+        for day in (1, 5, 10, 20):
+            commit = _make_commit(f"{day:012x}")
+            commit.date = datetime(2024, 1, day, tzinfo=timezone.utc)
+            commits.append(commit)
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=commits,
+        )
+
+        since = data.get_commits_since(datetime(2024, 1, 5, tzinfo=timezone.utc))
+        assert len(since) == 3
+        assert since[0].date.day == 5
+
+    def test_get_commits_since_unsorted(self):
+        """Test the linear fallback on unsorted histories."""
+        dates = (10, 1, 5)
+        commits = []
+        for day in dates:
+            commit = _make_commit(f"{day:012x}")
+            commit.date = datetime(2024, 1, day, tzinfo=timezone.utc)
+            commits.append(commit)
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=commits,
+        )
+
+        since = data.get_commits_since(datetime(2024, 1, 5, tzinfo=timezone.utc))
+        assert {c.date.day for c in since} == {5, 10}
+
+    def test_totals_follow_commit_list_changes(self):
+        """Test that cached totals are invalidated when commits change."""
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=[_make_commit("a" * 12, additions=10)],
+        )
+
+        assert data.get_total_additions() == 10
+
+        data.commits.append(_make_commit("b" * 12, additions=7))
+        assert data.get_total_additions() == 17
+
+
+class TestSharedAuthor:
+    """Tests for the flyweight author factory."""
+
+    def test_shared_author_returns_same_instance(self):
+        from wara9a.core.models import shared_author
+
+        first = shared_author(name="Jane Doe", email="jane@example.com")
+        second = shared_author(name="Jane Doe", email="jane@example.com")
+        other = shared_author(name="John Doe")
+
+        assert first is second
+        assert first is not other
+        assert first.name == "Jane Doe"
+
+
+class TestFilesColumns:
+    """Tests for the columnar files_changed view."""
+
+    def test_files_columns(self):
+        commit = _make_commit("a" * 12)
+        commit.files_changed = [
+            CodeChange(file_path="a.py", change_type="added", additions=5, language="Python"),
+            CodeChange(file_path="b.js", change_type="modified", additions=2, deletions=1,
+                       language="JavaScript"),
+        ]
+
+        columns = commit.files_columns()
+        assert columns["file_path"] == ["a.py", "b.js"]
+        assert columns["change_type"] == ["added", "modified"]
+        assert sum(columns["additions"]) == 7
+        assert sum(columns["deletions"]) == 1
+
+        # View tracks list growth
+        commit.files_changed.append(
+            CodeChange(file_path="c.py", change_type="deleted", deletions=9)
+        )
+        assert sum(commit.files_columns()["deletions"]) == 10
+
+
+class TestParseIsoDatetime:
+    """Tests for the fast ISO-8601 parsing helper."""
+
+    def test_parse_iso_datetime(self):
+        from wara9a.core.models import parse_iso_datetime
+
+        parsed = parse_iso_datetime("2024-06-01T12:30:00Z")
+        assert parsed == datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc)
+
+        # datetime objects and None pass through
+        now = datetime.now(timezone.utc)
+        assert parse_iso_datetime(now) is now
+        assert parse_iso_datetime(None) is None
+
+    def test_from_trusted_parses_string_dates(self):
+        commit = TechnicalCommit.from_trusted({
+            "sha": "a" * 12,
+            "short_sha": "a" * 7,
+            "message": "m",
+            "message_subject": "m",
+            "author": {"name": "Jane Doe"},
+            "date": "2024-06-01T12:30:00Z",
+        })
+
+        assert commit.date == datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class TestProjectData:
+    """Tests for the unified ProjectData helpers."""
+
+    def _make_release(self, tag: str, published_at=None, is_draft=False) -> Release:
+        return Release(
+            tag=tag,
+            name=f"Release {tag}",
+            author=Author(name="Jane Doe"),
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            published_at=published_at,
+            is_draft=is_draft,
+        )
+
+    def test_get_latest_release(self):
+        """Test that the latest published, non-draft release wins."""
+        data = ProjectData(
+            repository=Repository(name="repo", full_name="user/repo"),
+            source_type=SourceType.GITHUB,
+            releases=[
+                self._make_release("v1.0.0", datetime(2024, 1, 1, tzinfo=timezone.utc)),
+                self._make_release("v2.0.0", datetime(2024, 6, 1, tzinfo=timezone.utc)),
+                self._make_release("v3.0.0-draft",
+                                   datetime(2024, 7, 1, tzinfo=timezone.utc),
+                                   is_draft=True),
+                self._make_release("v0.9.0-unpublished"),
+            ],
+        )
+
+        latest = data.get_latest_release()
+        assert latest is not None
+        assert latest.tag == "v2.0.0"
+
+    def test_get_latest_release_empty(self):
+        """Test with no publishable release."""
+        data = ProjectData(
+            repository=Repository(name="repo", full_name="user/repo"),
+            source_type=SourceType.GITHUB,
+        )
+
+        assert data.get_latest_release() is None
+
+
+class TestMsgpackCache:
+    """Tests for the msgspec-backed binary cache round-trip."""
+
+    def test_msgpack_roundtrip(self):
+        """Test TechnicalData msgpack serialization round-trip."""
+        pytest.importorskip("msgspec")
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=[
+                TechnicalCommit(
+                    sha="abc123def456",
+                    short_sha="abc123d",
+                    message="fix: bug",
+                    message_subject="fix: bug",
+                    author=Author(name="Jane Doe"),
+                    date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    total_additions=3,
+                )
+            ],
+        )
+
+        buf = data.to_msgpack()
+        assert isinstance(buf, bytes)
+
+        restored = TechnicalData.from_msgpack(buf)
+        assert restored.repository_name == "test-repo"
+        assert len(restored.commits) == 1
+        assert restored.commits[0].author.name == "Jane Doe"
+        assert restored.commits[0].total_additions == 3
+
+    def test_msgpack_preserves_commit_shas(self):
+        """Test that PR commit references survive the round-trip."""
+        pytest.importorskip("msgspec")
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+            commits=[_make_commit("a" * 12)],
+            pull_requests=[
+                TechnicalPullRequest(
+                    id="1",
+                    number=1,
+                    title="Add feature",
+                    author=Author(name="Jane Doe"),
+                    status="merged",
+                    state="closed",
+                    source_branch="feature",
+                    target_branch="main",
+                    created_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    commit_shas=["a" * 12],
+                )
+            ],
+        )
+
+        restored = TechnicalData.from_msgpack(data.to_msgpack())
+
+        pr = restored.pull_requests[0]
+        assert pr.commit_shas == ["a" * 12]
+        assert [c.sha for c in pr.iter_commits(restored)] == ["a" * 12]
+
+    def test_msgpack_preserves_shared_diffs(self):
+        """Test that buffer-backed diffs survive the round-trip."""
+        pytest.importorskip("msgspec")
+
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+        )
+        ref = data.store_diff("--- a/a.py\n+++ b/a.py\n")
+        commit = _make_commit("a" * 12)
+        commit.files_changed = [
+            CodeChange(file_path="a.py", change_type="modified", diff_ref=ref),
+        ]
+        data.commits = [commit]
+
+        restored = TechnicalData.from_msgpack(data.to_msgpack())
+
+        change = restored.commits[0].files_changed[0]
+        assert tuple(change.diff_ref) == ref
+        assert change.get_diff(restored) == "--- a/a.py\n+++ b/a.py\n"
+
+
+class TestBulkIngest:
+    """Tests for the bulk list-validation helpers."""
+
+    def test_load_commits(self):
+        """Test ingesting a commit payload list in one pass."""
+        data = TechnicalData(
+            repository_name="test-repo",
+            source_type=SourceType.GITHUB,
+        )
+
+        data.load_commits([
+            {
+                "sha": "abc123def456",
+                "short_sha": "abc123d",
+                "message": "feat: add feature",
+                "message_subject": "feat: add feature",
+                "author": {"name": "Jane Doe"},
+                "date": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            },
+        ])
+
+        assert len(data.commits) == 1
+        assert isinstance(data.commits[0], TechnicalCommit)
+
+    def test_validate_code_changes(self):
+        """Test validating a file change payload list in one pass."""
+        changes = validate_code_changes([
+            {"file_path": "a.py", "change_type": "added", "additions": 1},
+            {"file_path": "b.py", "change_type": "unchanged"},
+        ])
+
+        assert [c.file_path for c in changes] == ["a.py", "b.py"]
+        assert isinstance(changes[0], CodeChange)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
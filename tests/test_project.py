@@ -0,0 +1,59 @@
+"""
+Tests for the Project orchestration class.
+"""
+
+import pytest
+
+from wara9a.core.config import (
+    Wara9aConfig, ProjectConfig, TemplateConfig, OutputConfig
+)
+from wara9a.core.project import Project
+
+
+def make_project(tmp_path, formats):
+    """Builds a Project with no sources writing into a tmp directory."""
+    config = Wara9aConfig(
+        project=ProjectConfig(name="Demo", description="Demo project"),
+        sources=[],
+        templates=[TemplateConfig(name="changelog", output="CHANGELOG.md")],
+        output=OutputConfig(directory=str(tmp_path / "out"), formats=formats),
+        auto_install_deps=False,
+    )
+    return Project(config=config)
+
+
+class TestGenerateDocuments:
+    """End-to-end tests for the collect + render + write pipeline."""
+
+    def test_generates_markdown_without_sources(self, tmp_path):
+        project = make_project(tmp_path, ["markdown"])
+
+        files = project.generate_documents()
+
+        assert len(files) == 1
+        assert files[0].name == "CHANGELOG.md"
+        assert "Changelog" in files[0].read_text(encoding="utf-8")
+
+    def test_generates_all_configured_formats(self, tmp_path):
+        project = make_project(tmp_path, ["markdown", "html"])
+
+        files = project.generate_documents()
+
+        assert sorted(f.suffix for f in files) == [".html", ".md"]
+        html = next(f for f in files if f.suffix == ".html")
+        assert html.read_text(encoding="utf-8").startswith("<!DOCTYPE html>")
+
+    def test_base_context_exposes_template_helpers(self, tmp_path):
+        project = make_project(tmp_path, ["markdown"])
+        project.collect_data()
+
+        context = project._build_base_context()
+
+        assert context["latest_release"] is None
+        assert context["open_issues"] == []
+        assert context["recent_commits"] == []
+
+    def test_validate_config_accepts_builtin_setup(self, tmp_path):
+        project = make_project(tmp_path, ["markdown"])
+
+        assert project.validate_config() == []
@@ -24,7 +24,7 @@ from wara9a.core.connector_base import GitConnector, ConnectorError, ConnectorCo
 from wara9a.core.models import (
     ProjectData, TechnicalData, Repository, Release,
     TechnicalCommit, TechnicalPullRequest, CodeChange, CodeMetrics,
-    Author, Label, SourceType
+    Author, Label, SourceType, parse_iso_datetime, shared_author
 )
 from wara9a.core.config import SourceConfig, GitHubSourceConfig
 
@@ -120,10 +120,6 @@ class GitHubConnector(GitConnector):
         logger.info(f"🔍 Collecting technical documentation from GitHub: {github_config.repo}")
         
         try:
-            # Configure authentication if token provided
-            if github_config.token:
-                self.session.headers['Authorization'] = f"token {github_config.token}"
-            
             # Collect repository info and releases
             repository = self._get_repository(github_config)
             releases = self._get_releases(github_config)
@@ -189,11 +185,20 @@ class GitHubConnector(GitConnector):
         
         return session
     
+    def probe_version(self, config: SourceConfig) -> Optional[str]:
+        """Returns the repository's last push timestamp as a version marker."""
+        if not isinstance(config, GitHubSourceConfig):
+            config = GitHubSourceConfig(**config.model_dump())
+
+        url = f"{self.BASE_URL}/repos/{config.repo}"
+        response = self._make_request(url, token=config.token)
+        return response.json().get('pushed_at')
+
     def _get_repository(self, config: GitHubSourceConfig) -> Repository:
         """Collects repository metadata."""
         url = f"{self.BASE_URL}/repos/{config.repo}"
-        response = self._make_request(url)
-        
+        response = self._make_request(url, token=config.token)
+
         repo_data = response.json()
         
         return Repository(
@@ -213,8 +218,8 @@ class GitHubConnector(GitConnector):
     def _get_languages(self, config: GitHubSourceConfig) -> List[str]:
         """Collecte les langages du repository."""
         url = f"{self.BASE_URL}/repos/{config.repo}/languages"
-        response = self._make_request(url)
-        
+        response = self._make_request(url, token=config.token)
+
         languages_data = response.json()
         # Sort by byte count (most used first)
         return list(languages_data.keys())
@@ -227,7 +232,7 @@ class GitHubConnector(GitConnector):
             'sha': config.branch or None
         }
         
-        response = self._make_request(url, params=params)
+        response = self._make_request(url, params=params, token=config.token)
         commits_data = response.json()
         
         commits = []
@@ -235,7 +240,7 @@ class GitHubConnector(GitConnector):
             # Get detailed commit info (includes file changes)
             detailed_url = f"{self.BASE_URL}/repos/{config.repo}/commits/{commit_data['sha']}"
             try:
-                detailed_response = self._make_request(detailed_url)
+                detailed_response = self._make_request(detailed_url, token=config.token)
                 detailed_data = detailed_response.json()
             except Exception as e:
                 logger.warning(f"Could not get details for commit {commit_data['sha'][:7]}: {e}")
@@ -314,7 +319,7 @@ class GitHubConnector(GitConnector):
             'direction': 'desc'
         }
         
-        response = self._make_request(url, params=params)
+        response = self._make_request(url, params=params, token=config.token)
         prs_data = response.json()
         
         pull_requests = []
@@ -326,7 +331,7 @@ class GitHubConnector(GitConnector):
             
             try:
                 reviews_url = f"{self.BASE_URL}/repos/{config.repo}/pulls/{pr_data['number']}/reviews"
-                reviews_response = self._make_request(reviews_url)
+                reviews_response = self._make_request(reviews_url, token=config.token)
                 reviews = reviews_response.json()
                 
                 review_comments_count = len(reviews)
@@ -386,10 +391,10 @@ class GitHubConnector(GitConnector):
     def _get_code_metrics(self, config: GitHubSourceConfig) -> Dict[str, CodeMetrics]:
         """Collects code metrics from repository languages statistics."""
         url = f"{self.BASE_URL}/repos/{config.repo}/languages"
-        response = self._make_request(url)
-        
+        response = self._make_request(url, token=config.token)
+
         languages_data = response.json()
-        
+
         # Convert byte counts to metrics
         metrics = {}
         total_bytes = sum(languages_data.values())
@@ -414,7 +419,7 @@ class GitHubConnector(GitConnector):
         url = f"{self.BASE_URL}/repos/{config.repo}/releases"
         params = {'per_page': 50}
         
-        response = self._make_request(url, params=params)
+        response = self._make_request(url, params=params, token=config.token)
         releases_data = response.json()
         
         releases = []
@@ -423,7 +428,7 @@ class GitHubConnector(GitConnector):
                 tag=release_data['tag_name'],
                 name=release_data['name'] or release_data['tag_name'],
                 description=release_data.get('body'),
-                author=self._parse_user_as_author(release_data['author']) if release_data.get('author') else Author(name="Unknown"),
+                author=self._parse_user_as_author(release_data['author']) if release_data.get('author') else shared_author(name="Unknown"),
                 created_at=self._parse_github_date(release_data['created_at']),
                 published_at=self._parse_github_date(release_data['published_at']) if release_data.get('published_at') else None,
                 is_prerelease=release_data['prerelease'],
@@ -434,10 +439,18 @@ class GitHubConnector(GitConnector):
         
         return releases
     
-    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        """Performs HTTP request with error handling."""
+    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None,
+                      token: Optional[str] = None) -> requests.Response:
+        """Performs HTTP request with error handling.
+
+        Authentication goes through per-request headers rather than the
+        session: connector instances are shared via the global registry
+        and collected in parallel, so mutating session headers would race
+        between sources with different tokens.
+        """
+        headers = {'Authorization': f"token {token}"} if token else None
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Check rate limits
@@ -468,7 +481,7 @@ class GitHubConnector(GitConnector):
             return None
         try:
             # GitHub utilise le format ISO avec Z pour UTC
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return parse_iso_datetime(date_str)
         except ValueError:
             logger.warning(f"Format de date invalide: {date_str}")
             return None
@@ -479,19 +492,19 @@ class GitHubConnector(GitConnector):
         author_info = commit_info['author']
         github_user = commit_data.get('author')
         
-        return Author(
+        return shared_author(
             name=author_info['name'],
             email=author_info['email'],
             username=github_user['login'] if github_user else None,
             avatar_url=github_user['avatar_url'] if github_user else None
         )
-    
+
     def _parse_user_as_author(self, user_data: Optional[Dict[str, Any]]) -> Author:
         """Parse un utilisateur GitHub en Author."""
         if not user_data:
-            return Author(name="Unknown")
-        
-        return Author(
+            return shared_author(name="Unknown")
+
+        return shared_author(
             name=user_data.get('name') or user_data['login'],
             username=user_data['login'],
             avatar_url=user_data.get('avatar_url')
@@ -17,7 +17,7 @@ import subprocess
 from wara9a.core.connector_base import FilesConnector, ConnectorError
 from wara9a.core.models import (
     ProjectData, TechnicalData, Repository, TechnicalCommit, Release,
-    Author, SourceType
+    Author, SourceType, shared_author
 )
 from wara9a.core.config import SourceConfig, LocalFilesSourceConfig
 
@@ -333,7 +333,7 @@ class LocalFilesConnector(FilesConnector):
                     message=full_message,
                     message_subject=message_subject,
                     message_body=message_body.strip() if message_body else None,
-                    author=Author(
+                    author=shared_author(
                         name=author_name,
                         email=author_email
                     ),
@@ -371,21 +371,39 @@ class LocalFilesConnector(FilesConnector):
         
         return releases
     
+    def _build_changelog_release(self, version: str, release_date: Optional[datetime],
+                                 description_lines: List[str]) -> Release:
+        """Builds a Release from parsed changelog pieces (Release is frozen)."""
+        return Release(
+            tag=f"v{version}",
+            name=version,
+            description='\n'.join(description_lines).strip(),
+            author=shared_author(name="Unknown"),
+            created_at=release_date or datetime.now(timezone.utc),
+            published_at=release_date,
+            is_prerelease='alpha' in version.lower() or 'beta' in version.lower() or 'rc' in version.lower(),
+            is_draft=False,
+            url=None
+        )
+
     def _parse_changelog_content(self, content: str) -> List[Release]:
         """Parse le contenu d'un changelog pour extraire les releases."""
         releases = []
-        
+
         # Regex to detect versions (common formats)
         version_patterns = [
             r'^##?\s*\[?v?(\d+\.\d+\.\d+[^\]]*)\]?\s*-?\s*(\d{4}-\d{2}-\d{2})?',  # ## [1.0.0] - 2023-01-01
             r'^##?\s*Version\s+(\d+\.\d+\.\d+[^\s]*)\s*\((\d{4}-\d{2}-\d{2})\)?',  # ## Version 1.0.0 (2023-01-01)
             r'^##?\s*(\d+\.\d+\.\d+[^\s]*)\s*\((\d{4}-\d{2}-\d{2})\)?',  # ## 1.0.0 (2023-01-01)
         ]
-        
+
         lines = content.split('\n')
-        current_release = None
+        # Release is immutable, so the version/date/description pieces are
+        # accumulated here and the Release built once a section is complete
+        current_version = None
+        current_date = None
         current_description = []
-        
+
         for line in lines:
             # Chercher un header de version
             version_found = False
@@ -393,47 +411,35 @@ class LocalFilesConnector(FilesConnector):
                 match = re.match(pattern, line.strip(), re.IGNORECASE)
                 if match:
                     # Save previous release
-                    if current_release:
-                        current_release.description = '\n'.join(current_description).strip()
-                        releases.append(current_release)
-                    
+                    if current_version:
+                        releases.append(self._build_changelog_release(
+                            current_version, current_date, current_description))
+
                     # Nouvelle release
-                    version = match.group(1)
+                    current_version = match.group(1)
                     date_str = match.group(2) if match.lastindex >= 2 else None
-                    
-                    release_date = None
+
+                    current_date = None
                     if date_str:
                         try:
-                            release_date = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+                            current_date = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
                         except ValueError:
                             pass
-                    
-                    current_release = Release(
-                        tag=f"v{version}",
-                        name=version,
-                        description="",
-                        author=Author(name="Unknown"),
-                        created_at=release_date or datetime.now(timezone.utc),
-                        published_at=release_date,
-                        is_prerelease='alpha' in version.lower() or 'beta' in version.lower() or 'rc' in version.lower(),
-                        is_draft=False,
-                        url=None
-                    )
-                    
+
                     current_description = []
                     version_found = True
                     break
-            
-            if not version_found and current_release:
+
+            if not version_found and current_version:
                 # Add to current release description
                 # Ignore lower level headers and empty lines at beginning
                 clean_line = line.strip()
                 if clean_line and not clean_line.startswith('###'):
                     current_description.append(line)
-        
+
         # Save last release
-        if current_release:
-            current_release.description = '\n'.join(current_description).strip()
-            releases.append(current_release)
-        
+        if current_version:
+            releases.append(self._build_changelog_release(
+                current_version, current_date, current_description))
+
         return releases
\ No newline at end of file
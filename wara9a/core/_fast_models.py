@@ -0,0 +1,217 @@
+"""
+msgspec mirrors of the technical models for fast cache I/O.
+
+Reloading a cached TechnicalData through full Pydantic validation is
+parse-bound and slow on large histories. These msgspec Structs decode a
+binary msgpack cache several times faster, then hand the data back to
+the Pydantic models through their validation-free from_trusted path.
+
+This module is internal: connectors and the cache layer should only go
+through TechnicalData.to_msgpack() / TechnicalData.from_msgpack().
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        "msgspec is required for the binary cache path. "
+        "Install it with: pip install msgspec"
+    ) from e
+
+
+class AuthorS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.Author."""
+    name: str
+    email: Optional[str] = None
+    username: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+
+class LabelS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.Label."""
+    name: str
+    color: Optional[str] = None
+    description: Optional[str] = None
+
+
+class CodeChangeS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.CodeChange."""
+    file_path: str
+    change_type: str
+    additions: int = 0
+    deletions: int = 0
+    changes: int = 0
+    language: Optional[str] = None
+    diff: Optional[str] = None
+    diff_ref: Optional[Tuple[int, int]] = None
+
+
+class TechnicalCommitS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.TechnicalCommit."""
+    sha: str
+    short_sha: str
+    message: str
+    message_subject: str
+    author: AuthorS
+    date: datetime
+    message_body: Optional[str] = None
+    committer: Optional[AuthorS] = None
+    url: Optional[str] = None
+    files_changed: List[CodeChangeS] = []
+    total_additions: int = 0
+    total_deletions: int = 0
+    branch: Optional[str] = None
+    tags: List[str] = []
+    is_merge: bool = False
+    parent_shas: List[str] = []
+    linked_issues: List[str] = []
+    linked_prs: List[str] = []
+
+
+class TechnicalPullRequestS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.TechnicalPullRequest."""
+    id: str
+    number: int
+    title: str
+    author: AuthorS
+    status: str
+    state: str
+    source_branch: str
+    target_branch: str
+    created_at: datetime
+    description: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    merged_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    reviewers: List[AuthorS] = []
+    approved_by: List[AuthorS] = []
+    review_comments_count: int = 0
+    commits: List[TechnicalCommitS] = []
+    commit_shas: List[str] = []
+    files_changed: int = 0
+    additions: int = 0
+    deletions: int = 0
+    url: Optional[str] = None
+    labels: List[LabelS] = []
+    milestone: Optional[str] = None
+    linked_issues: List[str] = []
+
+
+class CodeMetricsS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.CodeMetrics."""
+    language: str
+    files_count: int = 0
+    lines_of_code: int = 0
+    lines_blank: int = 0
+    lines_comment: int = 0
+    complexity: Optional[float] = None
+
+
+class TechnicalDebtS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.TechnicalDebt."""
+    id: str
+    title: str
+    description: str
+    severity: str
+    type: str
+    created_at: datetime
+    file_path: Optional[str] = None
+    line_number: Optional[int] = None
+    estimated_effort: Optional[str] = None
+    url: Optional[str] = None
+
+
+class TechnicalDataS(msgspec.Struct, frozen=True):
+    """msgspec mirror of models.TechnicalData."""
+    repository_name: str
+    source_type: str
+    commits: List[TechnicalCommitS] = []
+    pull_requests: List[TechnicalPullRequestS] = []
+    code_metrics: Dict[str, CodeMetricsS] = {}
+    technical_debt: List[TechnicalDebtS] = []
+    repository_url: Optional[str] = None
+    default_branch: str = "main"
+    collected_at: Optional[datetime] = None
+    # Shared diff storage referenced by CodeChangeS.diff_ref; lives in a
+    # private attr on the Pydantic side, so it is carried explicitly
+    diff_buffer: bytes = b""
+
+
+# Reusable encoder/decoder instances (construction is not free)
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(TechnicalDataS)
+
+
+def encode_technical_data(data) -> bytes:
+    """
+    Encodes a models.TechnicalData to compact msgpack bytes.
+
+    Args:
+        data: TechnicalData instance to serialize
+
+    Returns:
+        msgpack binary payload
+    """
+    payload = data.model_dump(mode="python")
+    payload["diff_buffer"] = bytes(data._diff_buffer)
+    return _encoder.encode(payload)
+
+
+def decode_technical_data(buf: bytes):
+    """
+    Decodes msgpack bytes back into a models.TechnicalData.
+
+    Decoding validates against the Struct mirrors (types, required
+    fields), so the Pydantic side can be rebuilt without re-validating.
+
+    Args:
+        buf: msgpack payload produced by encode_technical_data
+
+    Returns:
+        TechnicalData instance
+    """
+    from wara9a.core import models
+
+    struct = _decoder.decode(buf)
+    data = _struct_to_dict(struct)
+
+    diff_buffer = data.pop("diff_buffer", b"")
+
+    data["commits"] = [
+        models.TechnicalCommit.from_trusted(c) for c in data["commits"]
+    ]
+    data["pull_requests"] = [
+        models.TechnicalPullRequest.from_trusted(pr) for pr in data["pull_requests"]
+    ]
+    data["code_metrics"] = {
+        lang: models.CodeMetrics.model_construct(**metrics)
+        for lang, metrics in data["code_metrics"].items()
+    }
+    data["technical_debt"] = [
+        models.TechnicalDebt.model_construct(**debt) for debt in data["technical_debt"]
+    ]
+    if data.get("collected_at") is None:
+        # Let the Pydantic default_factory fill it in
+        data.pop("collected_at", None)
+
+    instance = models.TechnicalData.model_construct(**data)
+    if diff_buffer:
+        instance._diff_buffer = bytearray(diff_buffer)
+    return instance
+
+
+def _struct_to_dict(obj):
+    """Recursively converts msgspec Structs to plain dicts/lists."""
+    if isinstance(obj, msgspec.Struct):
+        return {
+            field: _struct_to_dict(getattr(obj, field))
+            for field in obj.__struct_fields__
+        }
+    if isinstance(obj, list):
+        return [_struct_to_dict(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _struct_to_dict(value) for key, value in obj.items()}
+    return obj
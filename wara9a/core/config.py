@@ -5,13 +5,22 @@ Manages the wara9a.yml file and configuration validation.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Literal, Optional, Dict, Any, Union
 from enum import Enum
 
 import yaml
 from pydantic import BaseModel, Field, ConfigDict, validator
 
+# Use the libyaml-backed loader when available (several times faster than
+# the pure-Python SafeLoader on large config files)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by (path, mtime_ns, size): reloading an unchanged
+# file skips both the YAML parse and the pydantic validation
+_config_cache: Dict[tuple, "Wara9aConfig"] = {}
+
 
 class OutputFormat(str, Enum):
     """Supported output formats."""
@@ -34,7 +43,7 @@ class SourceConfig(BaseModel):
 
 class GitHubSourceConfig(SourceConfig):
     """GitHub-specific configuration."""
-    type: str = Field(default="github", const=True)
+    type: Literal["github"] = Field(default="github")
     repo: str = Field(description="Repository au format owner/repo")
     token: Optional[str] = Field(default=None, description="GitHub access token")
     branch: Optional[str] = Field(default=None, description="Branch to analyze")
@@ -53,7 +62,7 @@ class GitHubSourceConfig(SourceConfig):
 
 class LocalFilesSourceConfig(SourceConfig):
     """Configuration pour les fichiers locaux."""
-    type: str = Field(default="local_files", const=True)
+    type: Literal["local_files"] = Field(default="local_files")
     path: str = Field(description="Chemin vers les fichiers")
     patterns: List[str] = Field(default=["**/*.md", "**/*.txt"], description="Patterns de fichiers")
     encoding: str = Field(default="utf-8", description="Encodage des fichiers")
@@ -109,18 +118,37 @@ class Wara9aConfig(BaseModel):
     cache_enabled: bool = Field(default=True, description="Cache enabled")
     cache_ttl: int = Field(default=3600, description="Cache TTL (seconds)")
     auto_install_deps: bool = Field(default=True, description="Automatic dependency installation")
-    
+
+    @cached_property
+    def project_dump(self) -> Dict[str, Any]:
+        """Dict form of the project config, built once per instance."""
+        return self.project.model_dump()
+
+    @cached_property
+    def config_dump(self) -> Dict[str, Any]:
+        """Dict form of the full config, built once per instance."""
+        return self.model_dump()
+
     @classmethod
     def load_from_file(cls, file_path: Union[str, Path]) -> "Wara9aConfig":
         """Charge la configuration depuis un fichier YAML."""
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        
+
+        stat = file_path.stat()
+        cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
-        return cls(**data)
+            data = yaml.load(f, Loader=_YAML_LOADER)
+
+        config = cls(**data)
+        _config_cache.clear()
+        _config_cache[cache_key] = config
+        return config
     
     def save_to_file(self, file_path: Union[str, Path]) -> None:
         """Sauvegarde la configuration dans un fichier YAML."""
@@ -10,7 +10,7 @@ Two main connector categories:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from enum import Enum
 
 from wara9a.core.models import ProjectData
@@ -105,6 +105,23 @@ class ConnectorBase(ABC):
         """
         pass
     
+    def probe_version(self, config: SourceConfig) -> Optional[str]:
+        """
+        Returns a cheap version marker for the source content.
+
+        Used by the incremental collection cache: if the marker has not
+        changed since the last run, the cached data can be reused without
+        a full collect. Examples: last push timestamp, HEAD SHA, ETag.
+
+        Args:
+            config: Configuration de la source
+
+        Returns:
+            Short version string, or None if the source cannot be probed
+            cheaply (disables caching for this source)
+        """
+        return None
+
     def test_connection(self, config: SourceConfig) -> bool:
         """
         Tests connection to source without collecting data.
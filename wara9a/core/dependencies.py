@@ -5,8 +5,10 @@ Automatically installs required dependencies according to
 connectors and generators used in configuration.
 """
 
+import os
 import subprocess
 import sys
+import sysconfig
 import logging
 from typing import Dict, List, Set, Optional
 from pathlib import Path
@@ -118,8 +120,9 @@ class DependencyManager:
                         missing["generators"].append("advanced_markdown")
                         missing["packages"].extend(deps["packages"])
         
-        # Deduplicate packages
-        missing["packages"] = list(set(missing["packages"]))
+        # Deduplicate packages while preserving first-seen order
+        # (deterministic order keeps pip install commands reproducible)
+        missing["packages"] = list(dict.fromkeys(missing["packages"]))
         
         return missing
     
@@ -155,6 +158,14 @@ class DependencyManager:
                 logger.info(f"  • {package}")
             return True
         
+        # Immutable environment (Nix, read-only container, etc.):
+        # pip install is guaranteed to fail, so don't even try
+        if not self._is_environment_writable():
+            logger.warning("⚠️ Python environment is read-only, skipping automatic installation")
+            for suggestion in self.suggest_manual_install(config):
+                logger.info(f"  • {suggestion}")
+            return False
+
         # Installation des packages
         logger.info("📦 Installing missing dependencies...")
         success = self._install_packages(missing["packages"])
@@ -168,6 +179,19 @@ class DependencyManager:
             logger.error("❌ Dependencies installation failed")
             return False
     
+    def _is_environment_writable(self) -> bool:
+        """Checks if packages can be installed in the current environment."""
+        # Nix store paths are always immutable
+        if sys.prefix.startswith("/nix/store"):
+            return False
+
+        try:
+            site_packages = sysconfig.get_paths()["purelib"]
+            return os.access(site_packages, os.W_OK)
+        except (KeyError, OSError):
+            # Unable to determine: let pip try anyway
+            return True
+
     def _check_import(self, module_name: str) -> bool:
         """Checks if a module can be imported."""
         try:
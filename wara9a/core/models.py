@@ -9,11 +9,61 @@ Standard outputs by documentation type:
 - Technical: Commit, PullRequest, CodeChange, TechnicalDebt
 """
 
+import operator
+import sys
+from array import array
+from bisect import bisect_left
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+from typing import List, Literal, Optional, Dict, Any, Tuple, Union
 from enum import Enum
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, TypeAdapter, model_validator
+
+
+try:
+    # C-accelerated ISO-8601 parser, ~10x faster than the stdlib
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def parse_iso_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """
+    Parses an ISO-8601 timestamp as fast as the environment allows.
+
+    Git API timestamps are tightly constrained ISO-8601 strings, so
+    connectors should pre-parse them with this helper and hand native
+    datetime objects to the models; Pydantic then accepts them with no
+    parsing work. Uses ciso8601 when installed, stdlib otherwise.
+
+    Args:
+        value: ISO-8601 string, datetime (passed through), or None
+
+    Returns:
+        Parsed datetime, or None for empty input
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    return _parse_iso(value)
+
+
+def _intern_str_fields(data: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """
+    Interns repeated string field values in a payload dict.
+
+    Fields like change_type, language or branch take a handful of
+    distinct values across thousands of objects; interning collapses the
+    duplicates to a single str object each, cutting resident memory on
+    large repositories.
+    """
+    for field in fields:
+        value = data.get(field)
+        if type(value) is str:
+            data[field] = sys.intern(value)
+    return data
 
 
 class SourceType(str, Enum):
@@ -52,6 +102,63 @@ class IssueType(str, Enum):
     STORY = "story"
 
 
+# Tagged value sets for hot fields: Literal lets pydantic-core validate
+# with an interned-string compare instead of generic str validation.
+# "removed"/"renamed"/"copied"/"changed"/"unchanged" are produced by the
+# GitHub file status API.
+ChangeType = Literal["added", "modified", "deleted", "removed", "renamed",
+                     "copied", "changed", "unchanged"]
+PullRequestStatus = Literal["open", "closed", "merged", "draft"]
+
+
+class Author(BaseModel):
+    """Represents an author (commit, issue, etc.)."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    name: str = Field(description="Full name")
+    email: Optional[str] = Field(default=None, description="Email address")
+    username: Optional[str] = Field(default=None, description="Username")
+    avatar_url: Optional[str] = Field(default=None, description="Avatar URL")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _intern_hot_fields(cls, data):
+        """Interns identity fields (same authors recur across commits)."""
+        if isinstance(data, dict):
+            _intern_str_fields(data, ("name", "email", "username"))
+        return data
+
+
+class Label(BaseModel):
+    """Represents a label/tag."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    name: str = Field(description="Label name")
+    color: Optional[str] = Field(default=None, description="Hexadecimal color")
+    description: Optional[str] = Field(default=None, description="Description")
+
+
+@lru_cache(maxsize=4096)
+def shared_author(name: str,
+                  email: Optional[str] = None,
+                  username: Optional[str] = None,
+                  avatar_url: Optional[str] = None) -> Author:
+    """
+    Returns a shared Author instance for the given identity.
+
+    Large repositories have a handful of authors contributing thousands
+    of commits each; this flyweight factory collapses those allocations
+    to one frozen instance per unique identity. Connectors should prefer
+    it over constructing Author directly in per-commit loops.
+    """
+    return Author.model_construct(
+        name=sys.intern(name),
+        email=sys.intern(email) if email is not None else None,
+        username=sys.intern(username) if username is not None else None,
+        avatar_url=avatar_url,
+    )
+
+
 # ============================================================================
 # FUNCTIONAL DOCUMENTATION MODELS (from Ticketing Systems)
 # ============================================================================
@@ -71,9 +178,9 @@ class Epic(BaseModel):
     description: Optional[str] = Field(default=None, description="Detailed description")
     status: IssueStatus = Field(description="Current status")
     priority: Priority = Field(default=Priority.UNDEFINED, description="Priority level")
-    author: "Author" = Field(description="Epic creator")
-    assignee: Optional["Author"] = Field(default=None, description="Epic owner")
-    labels: List["Label"] = Field(default_factory=list, description="Labels/tags")
+    author: Author = Field(description="Epic creator")
+    assignee: Optional[Author] = Field(default=None, description="Epic owner")
+    labels: List[Label] = Field(default_factory=list, description="Labels/tags")
     created_at: datetime = Field(description="Creation date")
     updated_at: Optional[datetime] = Field(default=None, description="Last update")
     closed_at: Optional[datetime] = Field(default=None, description="Closing date")
@@ -101,9 +208,9 @@ class Feature(BaseModel):
     priority: Priority = Field(default=Priority.UNDEFINED, description="Priority level")
     epic_id: Optional[str] = Field(default=None, description="Parent epic ID")
     epic_key: Optional[str] = Field(default=None, description="Parent epic key")
-    author: "Author" = Field(description="Feature creator")
-    assignee: Optional["Author"] = Field(default=None, description="Feature owner")
-    labels: List["Label"] = Field(default_factory=list, description="Labels/tags")
+    author: Author = Field(description="Feature creator")
+    assignee: Optional[Author] = Field(default=None, description="Feature owner")
+    labels: List[Label] = Field(default_factory=list, description="Labels/tags")
     created_at: datetime = Field(description="Creation date")
     updated_at: Optional[datetime] = Field(default=None, description="Last update")
     closed_at: Optional[datetime] = Field(default=None, description="Closing date")
@@ -132,9 +239,9 @@ class UserStory(BaseModel):
     story_points: Optional[int] = Field(default=None, description="Effort estimation")
     epic_id: Optional[str] = Field(default=None, description="Parent epic ID")
     feature_id: Optional[str] = Field(default=None, description="Parent feature ID")
-    author: "Author" = Field(description="Story creator")
-    assignee: Optional["Author"] = Field(default=None, description="Story assignee")
-    labels: List["Label"] = Field(default_factory=list, description="Labels/tags")
+    author: Author = Field(description="Story creator")
+    assignee: Optional[Author] = Field(default=None, description="Story assignee")
+    labels: List[Label] = Field(default_factory=list, description="Labels/tags")
     created_at: datetime = Field(description="Creation date")
     updated_at: Optional[datetime] = Field(default=None, description="Last update")
     closed_at: Optional[datetime] = Field(default=None, description="Closing date")
@@ -161,7 +268,7 @@ class Requirement(BaseModel):
     status: IssueStatus = Field(description="Current status")
     priority: Priority = Field(default=Priority.UNDEFINED, description="Priority level")
     category: Optional[str] = Field(default=None, description="Security, Performance, etc.")
-    author: "Author" = Field(description="Requirement creator")
+    author: Author = Field(description="Requirement creator")
     created_at: datetime = Field(description="Creation date")
     updated_at: Optional[datetime] = Field(default=None, description="Last update")
     url: Optional[str] = Field(default=None, description="Requirement URL")
@@ -211,15 +318,61 @@ class CodeChange(BaseModel):
     
     Standard output for all Git connectors (GitHub, GitLab, etc.)
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
     
     file_path: str = Field(description="Path to changed file")
-    change_type: str = Field(description="added, modified, deleted, renamed")
+    change_type: ChangeType = Field(description="added, modified, deleted, renamed")
     additions: int = Field(default=0, description="Lines added")
     deletions: int = Field(default=0, description="Lines deleted")
     changes: int = Field(default=0, description="Total changes")
     language: Optional[str] = Field(default=None, description="Programming language")
     diff: Optional[str] = Field(default=None, description="Diff content (optional)")
+    diff_ref: Optional[Tuple[int, int]] = Field(
+        default=None,
+        description="(offset, length) into the owning TechnicalData diff buffer"
+    )
+
+    def get_diff(self, data: "TechnicalData") -> Optional[str]:
+        """
+        Returns the diff text, resolving a shared-buffer reference.
+
+        Large diffs should be stored once in the owning TechnicalData
+        diff buffer (see TechnicalData.store_diff) and referenced by
+        offset/length here, so model copies and validation never touch
+        the megabytes of diff text.
+
+        Args:
+            data: The TechnicalData owning the shared diff buffer
+
+        Returns:
+            Diff text, or None if no diff was recorded
+        """
+        if self.diff is not None:
+            return self.diff
+        if self.diff_ref is None:
+            return None
+        offset, length = self.diff_ref
+        return bytes(data._diff_buffer[offset:offset + length]).decode("utf-8")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _intern_hot_fields(cls, data):
+        """Interns change_type/language (few distinct values, many objects)."""
+        if isinstance(data, dict):
+            _intern_str_fields(data, ("change_type", "language"))
+        return data
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "CodeChange":
+        """
+        Builds an instance without validation from trusted connector data.
+
+        Connectors talk to APIs (GitHub, GitLab, etc.) that already return
+        schema-conforming payloads, so full Pydantic validation on every
+        file change is wasted work. Only use this for data produced by a
+        connector; untrusted input must go through model_validate.
+        """
+        return cls.model_construct(**_intern_str_fields(dict(data), ("change_type", "language")))
 
 
 class TechnicalCommit(BaseModel):
@@ -228,15 +381,15 @@ class TechnicalCommit(BaseModel):
     
     Standard output for all Git connectors.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", revalidate_instances="never")
     
     sha: str = Field(description="Commit hash")
     short_sha: str = Field(description="Short commit hash (7 chars)")
     message: str = Field(description="Commit message")
     message_subject: str = Field(description="First line of message")
     message_body: Optional[str] = Field(default=None, description="Detailed message")
-    author: "Author" = Field(description="Commit author")
-    committer: Optional["Author"] = Field(default=None, description="Committer (if different)")
+    author: Author = Field(description="Commit author")
+    committer: Optional[Author] = Field(default=None, description="Committer (if different)")
     date: datetime = Field(description="Commit date")
     url: Optional[str] = Field(default=None, description="Commit URL")
     
@@ -255,6 +408,69 @@ class TechnicalCommit(BaseModel):
     linked_issues: List[str] = Field(default_factory=list, description="Referenced issue IDs")
     linked_prs: List[str] = Field(default_factory=list, description="Referenced PR IDs")
 
+    # Lazy columnar view of files_changed (invalidated on length change)
+    _files_soa: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _files_len_at_soa: int = PrivateAttr(default=-1)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _intern_hot_fields(cls, data):
+        """Interns the branch name (repeated across every commit)."""
+        if isinstance(data, dict):
+            _intern_str_fields(data, ("branch",))
+        return data
+
+    def files_columns(self) -> Dict[str, Any]:
+        """
+        Returns a columnar (struct-of-arrays) view of files_changed.
+
+        Bulk analytics that touch one field per change (totals per
+        language, counts per change_type) pay pointer-chasing through a
+        Python object per file in the row layout. The columns pack
+        additions/deletions as array('q') buffers and keep the string
+        fields as parallel lists, so aggregations run as flat C loops.
+
+        Returns:
+            Dict with file_path, change_type, language lists and
+            additions, deletions packed arrays, all index-aligned
+        """
+        if self._files_soa is None or self._files_len_at_soa != len(self.files_changed):
+            changes = self.files_changed
+            self._files_soa = {
+                "file_path": [c.file_path for c in changes],
+                "change_type": [c.change_type for c in changes],
+                "language": [c.language for c in changes],
+                "additions": array('q', map(operator.attrgetter('additions'), changes)),
+                "deletions": array('q', map(operator.attrgetter('deletions'), changes)),
+            }
+            self._files_len_at_soa = len(changes)
+        return self._files_soa
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TechnicalCommit":
+        """
+        Builds an instance without validation from trusted connector data.
+
+        Skips Pydantic validation (model_construct), which is 10-50x faster
+        on bulk construction of thousands of commits. Nested authors and
+        file changes are constructed the same way. Only use this for data
+        produced by a connector; untrusted input must go through
+        model_validate.
+        """
+        data = _intern_str_fields(dict(data), ("branch",))
+        if isinstance(data.get("date"), str):
+            data["date"] = parse_iso_datetime(data["date"])
+        if isinstance(data.get("author"), dict):
+            data["author"] = Author.model_construct(**data["author"])
+        if isinstance(data.get("committer"), dict):
+            data["committer"] = Author.model_construct(**data["committer"])
+        if "files_changed" in data:
+            data["files_changed"] = [
+                CodeChange.from_trusted(f) if isinstance(f, dict) else f
+                for f in data["files_changed"]
+            ]
+        return cls.model_construct(**data)
+
 
 class TechnicalPullRequest(BaseModel):
     """
@@ -262,14 +478,14 @@ class TechnicalPullRequest(BaseModel):
     
     Standard output for all Git connectors.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", revalidate_instances="never")
     
     id: str = Field(description="Unique identifier")
     number: int = Field(description="PR number")
     title: str = Field(description="PR title")
     description: Optional[str] = Field(default=None, description="PR description")
-    author: "Author" = Field(description="PR author")
-    status: str = Field(description="open, closed, merged, draft")
+    author: Author = Field(description="PR author")
+    status: PullRequestStatus = Field(description="open, closed, merged, draft")
     state: str = Field(description="Current state")
     
     # Branches
@@ -283,30 +499,88 @@ class TechnicalPullRequest(BaseModel):
     closed_at: Optional[datetime] = Field(default=None, description="Close date")
     
     # Code review
-    reviewers: List["Author"] = Field(default_factory=list, description="Assigned reviewers")
-    approved_by: List["Author"] = Field(default_factory=list, description="Approvers")
+    reviewers: List[Author] = Field(default_factory=list, description="Assigned reviewers")
+    approved_by: List[Author] = Field(default_factory=list, description="Approvers")
     review_comments_count: int = Field(default=0, description="Number of review comments")
     
     # Changes
     commits: List[TechnicalCommit] = Field(default_factory=list, description="Included commits")
+    commit_shas: List[str] = Field(
+        default_factory=list,
+        description="SHAs of included commits (resolved via the parent TechnicalData)"
+    )
     files_changed: int = Field(default=0, description="Number of changed files")
     additions: int = Field(default=0, description="Total lines added")
     deletions: int = Field(default=0, description="Total lines deleted")
     
     # Metadata
     url: Optional[str] = Field(default=None, description="PR URL")
-    labels: List["Label"] = Field(default_factory=list, description="PR labels")
+    labels: List[Label] = Field(default_factory=list, description="PR labels")
     milestone: Optional[str] = Field(default=None, description="Associated milestone")
     linked_issues: List[str] = Field(default_factory=list, description="Linked issue IDs")
 
+    def iter_commits(self, data: "TechnicalData"):
+        """
+        Yields the commits included in this pull request.
+
+        Prefers commit_shas resolved against the parent TechnicalData
+        index so commit objects exist once instead of being duplicated
+        into every PR; falls back to the embedded commits list. Unknown
+        SHAs are skipped.
+
+        Args:
+            data: The TechnicalData owning the commit collection
+        """
+        if self.commit_shas:
+            for sha in self.commit_shas:
+                commit = data.get_commit_by_sha(sha)
+                if commit is not None:
+                    yield commit
+        else:
+            yield from self.commits
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TechnicalPullRequest":
+        """
+        Builds an instance without validation from trusted connector data.
+
+        Same trust boundary as TechnicalCommit.from_trusted: connector
+        payloads are already schema-conforming, so Pydantic validation is
+        skipped for bulk construction speed. Untrusted input must go
+        through model_validate.
+        """
+        data = dict(data)
+        for field in ("created_at", "updated_at", "merged_at", "closed_at"):
+            if isinstance(data.get(field), str):
+                data[field] = parse_iso_datetime(data[field])
+        if isinstance(data.get("author"), dict):
+            data["author"] = Author.model_construct(**data["author"])
+        for field in ("reviewers", "approved_by"):
+            if field in data:
+                data[field] = [
+                    Author.model_construct(**a) if isinstance(a, dict) else a
+                    for a in data[field]
+                ]
+        if "commits" in data:
+            data["commits"] = [
+                TechnicalCommit.from_trusted(c) if isinstance(c, dict) else c
+                for c in data["commits"]
+            ]
+        if "labels" in data:
+            data["labels"] = [
+                Label.model_construct(**l) if isinstance(l, dict) else l
+                for l in data["labels"]
+            ]
+        return cls.model_construct(**data)
+
 
 class CodeMetrics(BaseModel):
     """
     Code metrics and statistics (technical documentation).
-    
+
     Standard output for code analysis.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
     
     language: str = Field(description="Programming language")
     files_count: int = Field(default=0, description="Number of files")
@@ -322,7 +596,7 @@ class TechnicalDebt(BaseModel):
     
     Can be extracted from code analysis, TODOs, or technical issues.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
     
     id: str = Field(description="Unique identifier")
     title: str = Field(description="Debt title")
@@ -342,7 +616,7 @@ class TechnicalData(BaseModel):
     
     All Git connectors (GitHub, GitLab, etc.) must return this structure.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", revalidate_instances="never")
     
     commits: List[TechnicalCommit] = Field(default_factory=list, description="Code commits")
     pull_requests: List[TechnicalPullRequest] = Field(default_factory=list, description="Pull/merge requests")
@@ -357,46 +631,175 @@ class TechnicalData(BaseModel):
     # Metadata
     collected_at: datetime = Field(default_factory=datetime.now, description="Collection timestamp")
     source_type: SourceType = Field(description="Source system type")
-    
+
+    # Cached line totals, packed as C arrays (invalidated on length change)
+    _additions_arr: Optional[array] = PrivateAttr(default=None)
+    _deletions_arr: Optional[array] = PrivateAttr(default=None)
+
+    # Lazy author -> commits index (invalidated on length change)
+    _author_index: Optional[Dict[str, List[TechnicalCommit]]] = PrivateAttr(default=None)
+    _commits_len_at_index: int = PrivateAttr(default=0)
+
+    # Commit dates for binary-searched range queries
+    _commit_dates: Optional[List[datetime]] = PrivateAttr(default=None)
+    _commit_dates_sorted: bool = PrivateAttr(default=False)
+    _commits_len_at_dates: int = PrivateAttr(default=-1)
+
+    # Lazy status -> pull requests partition (invalidated on length change)
+    _prs_by_status: Optional[Dict[str, List[TechnicalPullRequest]]] = PrivateAttr(default=None)
+    _prs_len_at_index: int = PrivateAttr(default=-1)
+
+    # Shared storage for large diff blobs (see CodeChange.diff_ref)
+    _diff_buffer: bytearray = PrivateAttr(default_factory=bytearray)
+
+    # Lazy sha -> commit index (invalidated on length change)
+    _commits_by_sha: Optional[Dict[str, TechnicalCommit]] = PrivateAttr(default=None)
+    _commits_len_at_sha_index: int = PrivateAttr(default=-1)
+
     def get_merged_prs(self) -> List[TechnicalPullRequest]:
         """Returns all merged pull requests."""
-        return [pr for pr in self.pull_requests if pr.status == "merged"]
-    
+        if self._prs_by_status is None or self._prs_len_at_index != len(self.pull_requests):
+            by_status: Dict[str, List[TechnicalPullRequest]] = {}
+            for pr in self.pull_requests:
+                by_status.setdefault(pr.status, []).append(pr)
+            self._prs_by_status = by_status
+            self._prs_len_at_index = len(self.pull_requests)
+        return self._prs_by_status.get("merged", [])
+
     def get_commits_by_author(self, author_name: str) -> List[TechnicalCommit]:
         """Returns all commits by a specific author."""
-        return [c for c in self.commits if c.author.name == author_name]
-    
+        if self._author_index is None or self._commits_len_at_index != len(self.commits):
+            index: Dict[str, List[TechnicalCommit]] = {}
+            for commit in self.commits:
+                index.setdefault(commit.author.name, []).append(commit)
+            self._author_index = index
+            self._commits_len_at_index = len(self.commits)
+        return self._author_index.get(author_name, [])
+
+    def load_commits(self, raw: List[Dict[str, Any]]) -> None:
+        """
+        Validates and stores a whole list of commit payloads at once.
+
+        A single TypeAdapter call iterates the list in pydantic-core
+        instead of paying per-element Python call overhead, which is the
+        fast way to ingest API response arrays.
+
+        Args:
+            raw: List of commit dicts from a connector
+        """
+        self.commits = _list_adapter(TechnicalCommit).validate_python(raw)
+
+    def load_pull_requests(self, raw: List[Dict[str, Any]]) -> None:
+        """
+        Validates and stores a whole list of pull request payloads at once.
+
+        Args:
+            raw: List of pull request dicts from a connector
+        """
+        self.pull_requests = _list_adapter(TechnicalPullRequest).validate_python(raw)
+
+    def store_diff(self, diff: str) -> Tuple[int, int]:
+        """
+        Appends diff text to the shared buffer.
+
+        Connectors should store large diffs here and put the returned
+        reference in CodeChange.diff_ref instead of CodeChange.diff, so
+        the text lives once in a flat buffer rather than per-model.
+
+        Args:
+            diff: Diff text to store
+
+        Returns:
+            (offset, length) reference for CodeChange.diff_ref
+        """
+        raw = diff.encode("utf-8")
+        offset = len(self._diff_buffer)
+        self._diff_buffer += raw
+        return offset, len(raw)
+
+    def get_commit_by_sha(self, sha: str) -> Optional[TechnicalCommit]:
+        """
+        Returns the commit with the given SHA, or None.
+
+        Backed by a lazily built sha -> commit index shared with
+        TechnicalPullRequest.iter_commits, so pull requests can
+        reference commits by SHA instead of duplicating the objects.
+        """
+        if self._commits_by_sha is None or self._commits_len_at_sha_index != len(self.commits):
+            self._commits_by_sha = {c.sha: c for c in self.commits}
+            self._commits_len_at_sha_index = len(self.commits)
+        return self._commits_by_sha.get(sha)
+
+    def get_commits_since(self, date: datetime) -> List[TechnicalCommit]:
+        """
+        Returns all commits dated at or after the given date.
+
+        Connectors insert commits chronologically, so the usual case is
+        answered with a binary search over a cached date column instead
+        of a full scan. Unsorted histories fall back to a linear filter.
+        """
+        if self._commit_dates is None or self._commits_len_at_dates != len(self.commits):
+            dates = [c.date for c in self.commits]
+            self._commit_dates = dates
+            self._commit_dates_sorted = all(
+                earlier <= later for earlier, later in zip(dates, dates[1:])
+            )
+            self._commits_len_at_dates = len(self.commits)
+
+        if self._commit_dates_sorted:
+            start = bisect_left(self._commit_dates, date)
+            return self.commits[start:]
+        return [c for c in self.commits if c.date >= date]
+
     def get_total_additions(self) -> int:
         """Returns total lines added across all commits."""
-        return sum(c.total_additions for c in self.commits)
-    
+        if self._additions_arr is None or len(self._additions_arr) != len(self.commits):
+            self._additions_arr = array(
+                'q', map(operator.attrgetter('total_additions'), self.commits)
+            )
+        return sum(self._additions_arr)
+
     def get_total_deletions(self) -> int:
         """Returns total lines deleted across all commits."""
-        return sum(c.total_deletions for c in self.commits)
+        if self._deletions_arr is None or len(self._deletions_arr) != len(self.commits):
+            self._deletions_arr = array(
+                'q', map(operator.attrgetter('total_deletions'), self.commits)
+            )
+        return sum(self._deletions_arr)
 
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes to compact msgpack bytes for the cache.
 
-class Author(BaseModel):
-    """Represents an author (commit, issue, etc.)."""
-    model_config = ConfigDict(extra="allow")
-    
-    name: str = Field(description="Full name")
-    email: Optional[str] = Field(default=None, description="Email address")
-    username: Optional[str] = Field(default=None, description="Username")
-    avatar_url: Optional[str] = Field(default=None, description="Avatar URL")
+        Requires the optional msgspec package.
 
+        Returns:
+            Binary payload for from_msgpack
+        """
+        from wara9a.core import _fast_models
+        return _fast_models.encode_technical_data(self)
 
-class Label(BaseModel):
-    """Represents a label/tag."""
-    model_config = ConfigDict(extra="allow")
-    
-    name: str = Field(description="Label name")
-    color: Optional[str] = Field(default=None, description="Hexadecimal color")
-    description: Optional[str] = Field(default=None, description="Description")
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "TechnicalData":
+        """
+        Deserializes a cached msgpack payload produced by to_msgpack.
+
+        Decoding is validated by msgspec Structs, so the models are
+        rebuilt through the fast from_trusted path.
+
+        Args:
+            buf: msgpack payload
+
+        Returns:
+            TechnicalData instance
+        """
+        from wara9a.core import _fast_models
+        return _fast_models.decode_technical_data(buf)
 
 
 class Release(BaseModel):
     """Represents a release/version."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
     
     tag: str = Field(description="Version tag")
     name: str = Field(description="Release name")
@@ -411,7 +814,7 @@ class Release(BaseModel):
 
 class Repository(BaseModel):
     """Represents a code repository."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
     
     name: str = Field(description="Repository name")
     full_name: str = Field(description="Full name (org/repo)")
@@ -441,7 +844,7 @@ class ProjectData(BaseModel):
     
     This allows templates to access standardized data regardless of source.
     """
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", revalidate_instances="never")
     
     # Standardized outputs by documentation type
     functional_data: Optional[FunctionalData] = Field(
@@ -461,6 +864,13 @@ class ProjectData(BaseModel):
     collected_at: datetime = Field(default_factory=datetime.now, description="Collection timestamp")
     source_type: SourceType = Field(description="Source type")
     source_config: Dict[str, Any] = Field(default_factory=dict, description="Connector config")
+
+    # Cached latest release (invalidated when the release list length changes)
+    _latest_release: Optional[Release] = PrivateAttr(default=None)
+    _releases_len_at_cache: int = PrivateAttr(default=-1)
+
+    # Cached documentation types (functional/technical data is set at collection)
+    _documentation_types: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
     
     def has_functional_data(self) -> bool:
         """Checks if functional documentation is available."""
@@ -472,18 +882,60 @@ class ProjectData(BaseModel):
     
     def get_documentation_types(self) -> List[str]:
         """Returns available documentation types."""
-        types = []
-        if self.has_functional_data():
-            types.append("functional")
-        if self.has_technical_data():
-            types.append("technical")
-        if not types:
-            types.append("legacy")
-        return types
-    
+        if self._documentation_types is None:
+            types: Tuple[str, ...] = ()
+            if self.has_functional_data():
+                types += ("functional",)
+            if self.has_technical_data():
+                types += ("technical",)
+            self._documentation_types = types or ("legacy",)
+        return list(self._documentation_types)
+    
+    def to_json(self) -> str:
+        """
+        Serializes to a JSON string directly in pydantic-core.
+
+        Faster than json.dumps(self.model_dump()): the Rust serializer
+        writes JSON without building an intermediate Python dict, and
+        None-valued optionals are skipped to shrink the payload.
+
+        Returns:
+            JSON representation of the project data
+        """
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+    def to_json_bytes(self) -> bytes:
+        """Returns the UTF-8 encoded to_json payload."""
+        return self.to_json().encode("utf-8")
+
     def get_latest_release(self) -> Optional[Release]:
         """Returns the latest published release."""
-        published_releases = [r for r in self.releases if r.published_at and not r.is_draft]
-        if not published_releases:
-            return None
-        return max(published_releases, key=lambda r: r.published_at)
\ No newline at end of file
+        if self._releases_len_at_cache != len(self.releases):
+            latest = None
+            latest_dt = None
+            for release in self.releases:
+                if release.is_draft or release.published_at is None:
+                    continue
+                if latest_dt is None or release.published_at > latest_dt:
+                    latest, latest_dt = release, release.published_at
+            self._latest_release = latest
+            self._releases_len_at_cache = len(self.releases)
+        return self._latest_release
+
+# ============================================================================
+# BULK VALIDATION ADAPTERS
+# ============================================================================
+
+# Built lazily on first bulk ingest: each adapter validates a whole list
+# in pydantic-core, so connectors ingest API response arrays without a
+# Python-level constructor call per element, but entry points that never
+# bulk-validate don't pay the schema-build cost at import.
+@lru_cache(maxsize=None)
+def _list_adapter(item_type) -> TypeAdapter:
+    """Returns the cached list TypeAdapter for a model type."""
+    return TypeAdapter(List[item_type])
+
+
+def validate_code_changes(raw: List[Dict[str, Any]]) -> List[CodeChange]:
+    """Validates a list of file change payloads in one pydantic-core pass."""
+    return _list_adapter(CodeChange).validate_python(raw)
@@ -5,21 +5,46 @@ Main entry point that orchestrates data collection,
 template application and document generation.
 """
 
+import hashlib
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from wara9a.core.config import Wara9aConfig, create_default_config
 from wara9a.core.models import ProjectData
-from wara9a.core.connector_registry import ConnectorRegistry
+from wara9a.core.connector_registry import get_global_registry
 from wara9a.core.template_engine import TemplateEngine
-from wara9a.core.dependencies import auto_check_and_install
-from wara9a.generators.markdown import MarkdownGenerator
-from wara9a.generators.html import HTMLGenerator
 
 
 logger = logging.getLogger(__name__)
 
+_logging_configured = False
+
+# Default TemplateEngine shared across Projects: building one means
+# registering all filters/globals and assembling the Jinja environment,
+# which is identical for every Project without custom template dirs
+_default_template_engine: Optional[TemplateEngine] = None
+
+
+def _shared_template_engine() -> TemplateEngine:
+    """Returns the process-wide default TemplateEngine, building it once."""
+    global _default_template_engine
+    if _default_template_engine is None:
+        _default_template_engine = TemplateEngine()
+    return _default_template_engine
+
+
+def _configure_logging(level_name: str) -> None:
+    """Configures root logging once per process, on first Project creation."""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(level=getattr(logging, level_name.upper()))
+        _logging_configured = True
+
 
 class Project:
     """
@@ -55,30 +80,70 @@ class Project:
                     "Use 'wara9a init' to create a project or specify the path."
                 )
         
-        # Initialize components
-        self.connector_registry = ConnectorRegistry()
-        self.template_engine = TemplateEngine()
-        self.generators = {
-            "markdown": MarkdownGenerator(),
-            "html": HTMLGenerator(),
+        # Initialize components (shared process-wide: connector discovery
+        # and Jinja environment setup only happen for the first Project)
+        self.connector_registry = get_global_registry()
+        self.template_engine = _shared_template_engine()
+
+        # Generators are imported and built lazily on first use: callers
+        # that only validate or collect never pay the import/constructor
+        # cost of the generator stack
+        self._generator_factories = {
+            "markdown": ("wara9a.generators.markdown", "MarkdownGenerator"),
+            "html": ("wara9a.generators.html", "HTMLGenerator"),
         }
+        self._generators: Dict[str, Any] = {}
         
         # Collected data
         self._project_data: Optional[ProjectData] = None
-        
+
+        # Template-independent rendering context, rebuilt when the data
+        # or the config changes
+        self._base_context: Optional[Dict[str, Any]] = None
+
+        # Dependencies are checked lazily, on the first real operation
+        self._deps_checked = False
+
+        # Enabled sources/templates, cached until the config is reloaded
+        self._enabled_sources_cache: Optional[List[Any]] = None
+        self._enabled_templates_cache: Optional[List[Any]] = None
+
+        # On-disk cache for collected data, keyed by source version
+        self._cache_dir = Path(self.config.output.directory) / ".wara9a_cache"
+
         # Log configuration
-        logging.basicConfig(level=getattr(logging, self.config.log_level.upper()))
-        
-        # Check and install dependencies automatically
+        _configure_logging(self.config.log_level)
+
         logger.info(f"Wara9a project initialized: {self.config.project.name}")
+
+    def _ensure_deps(self) -> None:
+        """Checks/installs dependencies once, before the first real operation."""
+        if self._deps_checked:
+            return
+
         logger.debug("Checking dependencies...")
-        
         try:
+            from wara9a.core.dependencies import auto_check_and_install
+
             auto_install = getattr(self.config, 'auto_install_deps', True)
             auto_check_and_install(config=self.config, auto_install=auto_install)
         except Exception as e:
             logger.warning(f"Unable to check dependencies automatically: {e}")
             logger.info("You can check them manually with 'wara9a deps check'")
+
+        self._deps_checked = True
+
+    def _enabled_sources(self) -> List[Any]:
+        """Enabled source configs, computed once per loaded config."""
+        if self._enabled_sources_cache is None:
+            self._enabled_sources_cache = list(self.config.get_enabled_sources())
+        return self._enabled_sources_cache
+
+    def _enabled_templates(self) -> List[Any]:
+        """Enabled template configs, computed once per loaded config."""
+        if self._enabled_templates_cache is None:
+            self._enabled_templates_cache = list(self.config.get_enabled_templates())
+        return self._enabled_templates_cache
     
     @classmethod
     def create_new(cls, 
@@ -127,41 +192,79 @@ class Project:
         Returns:
             Normalized project data
         """
+        self._ensure_deps()
+
         logger.info("Starting data collection")
-        
+
         # TODO: Implement cache
         if not force_refresh and self._project_data:
             logger.info("Using cached data")
             return self._project_data
         
         all_data = []
-        
-        # Collect from each enabled source
-        for source_config in self.config.get_enabled_sources():
-            logger.info(f"Collecting from {source_config.type}: {source_config.name or 'Unnamed'}")
-            
-            try:
-                # Get appropriate connector
-                connector = self.connector_registry.get_connector(source_config.type)
-                
-                # Collect data
-                source_data = connector.collect(source_config)
-                all_data.append(source_data)
-                
-                logger.info(f"Collection complete: {len(source_data.commits)} commits, "
-                          f"{len(source_data.issues)} issues, "
-                          f"{len(source_data.pull_requests)} PRs")
-                
-            except Exception as e:
-                logger.error(f"Erreur lors de la collecte depuis {source_config.type}: {e}")
-                if not self.config.get("continue_on_error", True):
-                    raise
+        sources = self._enabled_sources()
+
+        # Collect from all enabled sources in parallel: each collect()
+        # mostly waits on network I/O, so overlapping sources hides latency.
+        # Futures are consumed in submission order to keep results deterministic.
+        def _collect_one(source_config):
+            connector = self.connector_registry.get_connector(source_config.type)
+
+            # Incremental cache: if the source advertises a cheap version
+            # marker and it matches the last collected one, reuse the
+            # persisted data instead of re-collecting everything
+            version = None
+            if not force_refresh and self.config.cache_enabled:
+                try:
+                    version = connector.probe_version(source_config)
+                except Exception as e:
+                    logger.debug(f"Unable to probe version for {source_config.type}: {e}")
+
+                if version:
+                    cached = self._load_source_cache(source_config, version)
+                    if cached is not None:
+                        logger.info(f"Source unchanged, using cached data: "
+                                    f"{source_config.name or source_config.type}")
+                        return cached
+
+            source_data = connector.collect(source_config)
+
+            if version:
+                self._write_source_cache(source_config, version, source_data)
+
+            return source_data
+
+        if sources:
+            with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+                futures = []
+                for source_config in sources:
+                    logger.info(f"Collecting from {source_config.type}: {source_config.name or 'Unnamed'}")
+                    futures.append((source_config, executor.submit(_collect_one, source_config)))
+
+                for source_config, future in futures:
+                    try:
+                        source_data = future.result()
+                        all_data.append(source_data)
+
+                        technical = source_data.technical_data
+                        if technical:
+                            logger.info(f"Collection complete: {len(technical.commits)} commits, "
+                                      f"{len(technical.pull_requests)} PRs, "
+                                      f"{len(source_data.releases)} releases")
+                        else:
+                            logger.info("Collection complete")
+
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la collecte depuis {source_config.type}: {e}")
+                        if not getattr(self.config, "continue_on_error", True):
+                            raise
         
         # Merge all data
         # For now, we take the first source as base
         # TODO: Implement real smart merge
         if all_data:
             self._project_data = all_data[0]
+            self._base_context = None
             logger.info("Data collection completed successfully")
         else:
             logger.warning("No data collected")
@@ -175,10 +278,58 @@ class Project:
                 ),
                 source_type=SourceType.LOCAL_FILES
             )
-        
+            self._base_context = None
+
         return self._project_data
     
-    def generate_documents(self, 
+    def _source_cache_path(self, source_config) -> Path:
+        """Cache file path for a source, with a filesystem-safe name.
+
+        The name alone is not a safe key: unnamed sources of the same
+        type would share one file, and a renamed repo/path could serve
+        another source's data. A fingerprint of the config (credentials
+        excluded) ties each cache file to the exact source it came from.
+        """
+        name = source_config.name or source_config.type
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        fingerprint = hashlib.sha1(json.dumps(
+            source_config.model_dump(mode="json", exclude={"token"}),
+            sort_keys=True,
+        ).encode("utf-8")).hexdigest()[:12]
+        return self._cache_dir / f"{safe_name}-{fingerprint}.json"
+
+    def _load_source_cache(self, source_config, version: str) -> Optional[ProjectData]:
+        """Loads cached data for a source if its version still matches."""
+        cache_path = self._source_cache_path(source_config)
+        if not cache_path.exists():
+            return None
+
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            if payload.get("version") != version:
+                return None
+            return ProjectData.model_validate(payload["data"])
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache {cache_path}: {e}")
+            return None
+
+    def _write_source_cache(self, source_config, version: str, data: ProjectData) -> None:
+        """Persists collected data alongside its source version marker."""
+        cache_path = self._source_cache_path(source_config)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # source_config holds the raw connector config, credentials
+            # included; it never goes into the on-disk cache, which lives
+            # inside the output directory users publish
+            payload = {
+                "version": version,
+                "data": data.model_dump(mode="json", exclude={"source_config"}),
+            }
+            cache_path.write_text(json.dumps(payload), encoding="utf-8")
+        except Exception as e:
+            logger.debug(f"Unable to write cache {cache_path}: {e}")
+
+    def generate_documents(self,
                           templates: Optional[List[str]] = None,
                           output_dir: Optional[Path] = None) -> List[Path]:
         """
@@ -191,97 +342,174 @@ class Project:
         Returns:
             List of generated files
         """
+        self._ensure_deps()
+
         if not self._project_data:
             self.collect_data()
-        
+
         if output_dir is None:
             output_dir = Path(self.config.output.directory)
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Clean directory if requested
+        # Clean directory if requested. os.scandir caches file-type info in
+        # its DirEntry objects, avoiding the extra stat() per entry that
+        # Path.glob + is_file() would issue.
         if self.config.output.clean_before:
             logger.info(f"Nettoyage du dossier de sortie: {output_dir}")
-            for file in output_dir.glob("*"):
-                if file.is_file():
-                    file.unlink()
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
         
         generated_files = []
-        templates_to_use = templates or [t.name for t in self.config.get_enabled_templates()]
-        
+        templates_to_use = templates or [t.name for t in self._enabled_templates()]
+
         logger.info(f"Generating {len(templates_to_use)} documents")
-        
+
+        # Compute the template-independent parts of the context once:
+        # model_dump() deep-copies the whole model tree and the same
+        # project/config/data dumps would otherwise be rebuilt per template
+        base_context = self._build_base_context()
+
+        # One dict build instead of a linear scan per requested template
+        templates_by_name = {t.name: t for t in self.config.templates}
+        output_base = os.fspath(output_dir)
+
+        # Pre-bind the work plan: resolve template configs, generators and
+        # output paths once, so the rendering loop only renders and writes.
+        # Paths are built with plain string ops, cheaper than Path division
+        # + with_suffix per output.
+        plan: List[Any] = []
         for template_name in templates_to_use:
             # Trouver la configuration du template
-            template_config = next(
-                (t for t in self.config.templates if t.name == template_name),
-                None
-            )
-            
+            template_config = templates_by_name.get(template_name)
+
             if not template_config:
                 logger.warning(f"Template not found in configuration: {template_name}")
                 continue
-            
+
             if not template_config.enabled:
                 logger.info(f"Template disabled: {template_name}")
                 continue
-            
+
+            stem, _ = os.path.splitext(template_config.output)
+            outputs = []
+            for format_name in self.config.output.formats:
+                # Ajuster l'extension selon le format
+                if format_name == "markdown":
+                    filename = template_config.output
+                else:
+                    filename = f"{stem}.{format_name}"
+
+                generator = self._get_generator(format_name)
+                if generator:
+                    outputs.append((generator, Path(os.path.join(output_base, filename))))
+                else:
+                    logger.error(f"Generator not found for format: {format_name}")
+
+            plan.append((template_config, outputs))
+
+        def _render_one(item) -> List[Path]:
+            template_config, outputs = item
+
+            files: List[Path] = []
             try:
-                logger.info(f"Generating template: {template_name}")
-                
+                logger.info(f"Generating template: {template_config.name}")
+
                 # Prepare context for template
-                context = self._prepare_template_context(template_config)
-                
+                context = self._prepare_template_context(template_config, base_context)
+
                 # Rendre le template
-                content = self.template_engine.render(template_name, context, template_config)
-                
+                content = self.template_engine.render(template_config.name, context, template_config)
+
                 # Generate files in requested formats
-                for format_name in self.config.output.formats:
-                    output_file = output_dir / template_config.output
-                    
-                    # Ajuster l'extension selon le format
-                    if format_name != "markdown":
-                        output_file = output_file.with_suffix(f".{format_name}")
-                    
-                    generator = self.generators.get(format_name)
-                    if generator:
-                        final_path = generator.generate(content, output_file, context)
-                        generated_files.append(final_path)
-                        logger.info(f"Document generated: {final_path}")
-                    else:
-                        logger.error(f"Generator not found for format: {format_name}")
-                
+                for generator, output_file in outputs:
+                    final_path = generator.generate(content, output_file, context)
+                    files.append(final_path)
+                    logger.info(f"Document generated: {final_path}")
+
             except Exception as e:
-                logger.error(f"Error generating template {template_name}: {e}")
-                if not self.config.get("continue_on_error", True):
+                logger.error(f"Error generating template {template_config.name}: {e}")
+                if not getattr(self.config, "continue_on_error", True):
                     raise
-        
+
+            return files
+
+        # Templates are independent of each other; render and write them in
+        # parallel so Jinja rendering overlaps with the file I/O of others
+        if plan:
+            with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 4, len(plan))) as executor:
+                for files in executor.map(_render_one, plan):
+                    generated_files.extend(files)
+
+        # One directory fsync for the whole batch instead of one per file
+        if generated_files:
+            from wara9a.generators.base import GeneratorBase
+            GeneratorBase.flush_batch()
+
         logger.info(f"Generation completed: {len(generated_files)} files created")
         return generated_files
     
-    def _prepare_template_context(self, template_config) -> Dict[str, Any]:
-        """Prepares variable context for a template."""
+    def _get_generator(self, format_name: str):
+        """Returns the generator for a format, building it on first use."""
+        generator = self._generators.get(format_name)
+        if generator is None:
+            factory = self._generator_factories.get(format_name)
+            if factory is None:
+                return None
+            module_name, class_name = factory
+            generator = getattr(import_module(module_name), class_name)()
+            self._generators[format_name] = generator
+        return generator
+
+    def _build_base_context(self) -> Dict[str, Any]:
+        """Builds the template-independent part of the rendering context.
+
+        Cached on the instance; invalidated by collect_data/reload_config.
+        """
+        if self._base_context is not None:
+            return self._base_context
+
         context = {
-            # Project data
-            "project": self.config.project.model_dump(),
-            "data": self._project_data.model_dump() if self._project_data else {},
-            
+            # Project data. The collected data is passed as the model
+            # itself: Jinja resolves attribute access directly, so there is
+            # no need to model_dump() thousands of nested commits/issues
+            "project": self.config.project_dump,
+            "data": self._project_data if self._project_data else {},
+
             # Helpers et filtres
-            "config": self.config.model_dump(),
-            "template": template_config.model_dump(),
-            
-            # Custom template variables
-            **template_config.variables,
+            "config": self.config.config_dump,
         }
-        
+
         # Ajouter des helpers utiles
         if self._project_data:
+            technical = self._project_data.technical_data
             context.update({
                 "latest_release": self._project_data.get_latest_release(),
-                "open_issues": self._project_data.get_open_issues(),
-                "recent_commits": self._project_data.commits[:10] if self._project_data.commits else [],
+                # The unified ProjectData model carries no issue list; keep
+                # the key so templates can iterate it unconditionally
+                "open_issues": getattr(self._project_data, "issues", None) or [],
+                "recent_commits": technical.commits[:10] if technical else [],
             })
-        
+
+        self._base_context = context
+        return context
+
+    def _prepare_template_context(self, template_config,
+                                  base_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Prepares variable context for a template."""
+        if base_context is None:
+            base_context = self._build_base_context()
+
+        context = {
+            **base_context,
+            "template": template_config.model_dump(),
+
+            # Custom template variables
+            **template_config.variables,
+        }
+
         return context
     
     def validate_config(self) -> List[str]:
@@ -292,21 +520,26 @@ class Project:
             List of errors found (empty if all OK)
         """
         errors = []
-        
+
+        # Snapshot known connectors/templates once instead of one registry
+        # or loader probe per configured entry
+        known_connectors = set(self.connector_registry.list_connector_types())
+        known_templates = set(self.template_engine.list_templates())
+
         # Valider les sources
         for source in self.config.sources:
-            if not self.connector_registry.has_connector(source.type):
+            if source.type not in known_connectors:
                 errors.append(f"Connecteur non disponible: {source.type}")
-        
+
         # Valider les templates
         for template in self.config.templates:
-            if not self.template_engine.has_template(template.name):
+            if template.name not in known_templates:
                 if not template.template_file:
                     errors.append(f"Template not found: {template.name}")
         
         # Validate generators
         for format_name in self.config.output.formats:
-            if format_name not in self.generators:
+            if format_name not in self._generator_factories:
                 errors.append(f"Generator not available: {format_name}")
         
         return errors
@@ -315,6 +548,9 @@ class Project:
         """Recharge la configuration depuis le fichier."""
         if self.config_path:
             self.config = Wara9aConfig.load_from_file(self.config_path)
+            self._enabled_sources_cache = None
+            self._enabled_templates_cache = None
+            self._base_context = None
             logger.info("Configuration reloaded")
         else:
             logger.warning("Cannot reload: configuration not linked to file")
\ No newline at end of file
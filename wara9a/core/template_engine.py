@@ -267,6 +267,10 @@ class TemplateEngine:
             logger.error(f"Erreur lors du rendu du template {template_name}: {e}")
             raise
     
+    def list_templates(self) -> List[str]:
+        """Returns all template names known to the environment."""
+        return self.env.list_templates()
+
     def has_template(self, template_name: str) -> bool:
         """Checks if a template exists."""
         try:
@@ -327,25 +331,32 @@ class TemplateEngine:
                 return text or ""
             return text[:length - len(end)] + end
         
-        def select_since_release(commits: List[Dict], release: Dict) -> List[Dict]:
+        def _field(obj, name, default=None):
+            """Reads a field from a dict or a pydantic model alike."""
+            if isinstance(obj, dict):
+                return obj.get(name, default)
+            value = getattr(obj, name, default)
+            return default if value is None else value
+
+        def select_since_release(commits: List[Any], release: Any) -> List[Any]:
             """Selects commits since a release."""
             if not release or not commits:
                 return []
-            
-            release_date = release.get('created_at')
+
+            release_date = _field(release, 'created_at')
             if not release_date:
                 return commits
-                
-            return [c for c in commits if c.get('date', datetime.min) >= release_date]
-        
-        def select_since_previous_release(commits: List[Dict], current_release: Dict) -> List[Dict]:
+
+            return [c for c in commits if _field(c, 'date', datetime.min) >= release_date]
+
+        def select_since_previous_release(commits: List[Any], current_release: Any) -> List[Any]:
             """Selects commits since previous release."""
             # For now, return all commits from the last week
             if not commits:
                 return []
-                
+
             week_ago = datetime.now() - timedelta(days=7)
-            return [c for c in commits if c.get('date', datetime.min) >= week_ago]
+            return [c for c in commits if _field(c, 'date', datetime.min) >= week_ago]
         
         # Enregistrer les filtres
         self.env.filters['format_date'] = format_date
@@ -2,9 +2,29 @@
 Base class for all Wara9a output generators.
 """
 
+import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Parent directories already created during this process: with N templates
+# x M formats all landing in the same output dir, one mkdir is enough
+_created_dirs: Set[Path] = set()
+
+# Directories with writes not yet flushed to stable storage; fsynced in
+# one batch by flush_batch() instead of once per file
+_dirty_dirs: Set[Path] = set()
+
+
+def _generate_job(args) -> Path:
+    """Worker for generate_many: runs one job in a fresh generator."""
+    generator_cls, content, output_path, context = args
+    return generator_cls().generate(content, output_path, context)
 
 
 class GeneratorBase(ABC):
@@ -54,8 +74,87 @@ class GeneratorBase(ABC):
         """
         if output_path.suffix != self.file_extension:
             output_path = output_path.with_suffix(self.file_extension)
-        
-        # Create parent directory if necessary
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        return output_path
\ No newline at end of file
+
+        # Create parent directory if necessary (once per directory)
+        parent = output_path.parent
+        if parent not in _created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(parent)
+
+        return output_path
+
+    def generate_many(self, jobs: List[Tuple[str, Path, Dict[str, Any]]]) -> List[Path]:
+        """
+        Generates a batch of documents, fanning out across CPU cores.
+
+        Conversion is CPU-bound per document, so large batches are mapped
+        over a ProcessPoolExecutor (each worker builds its own generator,
+        since instances carry per-thread parser state). Small batches run
+        serially to avoid process startup and pickling overhead.
+
+        Args:
+            jobs: List of (content, output_path, context) tuples
+
+        Returns:
+            Paths of the generated files, in job order
+        """
+        if len(jobs) <= 2:
+            return [self.generate(*job) for job in jobs]
+
+        args = [(type(self), content, output_path, context)
+                for content, output_path, context in jobs]
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_generate_job, args, chunksize=16))
+
+    def write_output(self, output_path: Path, content: str) -> None:
+        """
+        Writes the final content atomically in a single buffered operation.
+
+        The content goes to a temporary sibling first and is moved into
+        place with os.replace, so readers (doc-preview watchers, parallel
+        template workers) never observe a half-written file. If the file
+        already holds exactly these bytes the write is skipped entirely,
+        preserving mtimes for downstream rsync/CDN-style caches.
+
+        Args:
+            output_path: Destination file
+            content: Full document content
+        """
+        new_bytes = content.encode("utf-8")
+
+        try:
+            if output_path.read_bytes() == new_bytes:
+                logger.debug(f"Output unchanged, skipping write: {output_path}")
+                return
+        except OSError:
+            pass
+
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        tmp_path.write_bytes(new_bytes)
+        os.replace(tmp_path, output_path)
+        _dirty_dirs.add(output_path.parent)
+
+    @staticmethod
+    def flush_batch() -> None:
+        """
+        Flushes all directories written since the last call to stable
+        storage in one pass.
+
+        Individual writes skip fsync on purpose: per-file fsync stalls
+        dominate SSD throughput on large builds, and one directory fsync
+        at end-of-batch gives the same durability for the whole run.
+        """
+        if not hasattr(os, 'O_DIRECTORY'):
+            _dirty_dirs.clear()
+            return
+
+        while _dirty_dirs:
+            directory = _dirty_dirs.pop()
+            try:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
\ No newline at end of file
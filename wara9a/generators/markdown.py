@@ -6,14 +6,90 @@ rendered by templates to .md files.
 """
 
 import logging
+import os
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any
 
+import yaml
+
+try:
+    # libyaml-backed emitter, ~10x faster than the pure-Python one
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 from wara9a.generators.base import GeneratorBase
 
 
 logger = logging.getLogger(__name__)
 
+# SOURCE_DATE_EPOCH pins the generation timestamp for reproducible
+# builds; rendered in UTC so it is identical across build machines
+try:
+    _FIXED_TS = datetime.fromtimestamp(
+        int(os.environ['SOURCE_DATE_EPOCH']), tz=timezone.utc
+    ).isoformat()
+except (KeyError, ValueError):
+    _FIXED_TS = None
+
+# Timestamp shared by all documents generated within the same second
+_ts_cache = [0.0, '']
+
+
+def _generation_timestamp() -> str:
+    """ISO timestamp for front matter, cached at second granularity."""
+    if _FIXED_TS is not None:
+        return _FIXED_TS
+
+    now = time.time()
+    if now - _ts_cache[0] >= 1.0:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _ts_cache[1]
+
+
+# Known front-matter keys, emitted in this order
+_FRONT_MATTER_KEYS = ('title', 'description', 'author', 'template',
+                      'generated_at', 'generator')
+
+
+# Escapes for double-quoted YAML scalars: specials, then every other
+# control character as \xNN so multi-line descriptions stay well-formed
+_YAML_ESCAPES = {ord('\\'): '\\\\', ord('"'): '\\"',
+                 ord('\n'): '\\n', ord('\r'): '\\r', ord('\t'): '\\t'}
+_YAML_ESCAPES.update({c: f'\\x{c:02x}' for c in range(0x20)
+                      if c not in _YAML_ESCAPES})
+
+
+def _yaml_quote(value: str) -> str:
+    """Double-quotes a scalar for YAML, escaping specials and control chars."""
+    return '"' + value.translate(_YAML_ESCAPES) + '"'
+
+
+def _format_front_matter(metadata: Dict[str, Any]) -> str:
+    """
+    Emits YAML front matter for the fixed metadata schema by hand.
+
+    The metadata dict only ever holds a handful of plain strings, so the
+    full YAML emitter is overkill. Raises TypeError on anything outside
+    the known string-only schema; the caller falls back to yaml.dump.
+    """
+    if set(metadata) - set(_FRONT_MATTER_KEYS):
+        raise TypeError("unexpected front-matter key")
+
+    lines = ['---\n']
+    for key in _FRONT_MATTER_KEYS:
+        value = metadata.get(key)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            raise TypeError(f"non-string front-matter value for {key!r}")
+        lines.append(f'{key}: {_yaml_quote(value)}\n')
+    lines.append('---\n\n')
+    return ''.join(lines)
+
 
 class MarkdownGenerator(GeneratorBase):
     """
@@ -50,7 +126,7 @@ class MarkdownGenerator(GeneratorBase):
             final_content = self._add_metadata(content, context)
             
             # Write file
-            output_path.write_text(final_content, encoding='utf-8')
+            self.write_output(output_path, final_content)
             
             logger.info(f"Markdown file generated: {output_path}")
             return output_path
@@ -70,8 +146,14 @@ class MarkdownGenerator(GeneratorBase):
         Returns:
             Content with metadata
         """
-        # If content already starts with ---, do nothing
-        if content.strip().startswith('---'):
+        # If content already starts with --- (ignoring leading blanks), do
+        # nothing. Checked with a prefix scan: content.strip() would copy
+        # the whole body just to look at three characters
+        i = 0
+        n = len(content)
+        while i < n and content[i] in ' \t\r\n':
+            i += 1
+        if content.startswith('---', i):
             return content
         
         # Extract some useful metadata from context
@@ -91,14 +173,16 @@ class MarkdownGenerator(GeneratorBase):
                 metadata['template'] = template['name']
         
         # Add generation date
-        from datetime import datetime
-        metadata['generated_at'] = datetime.now().isoformat()
+        metadata['generated_at'] = _generation_timestamp()
         metadata['generator'] = 'Wara9a'
         
         # If we have metadata, add it as front matter
         if metadata:
-            import yaml
-            front_matter = yaml.dump(metadata, default_flow_style=False, allow_unicode=True)
-            return f"---\n{front_matter}---\n\n{content}"
-        
+            try:
+                return _format_front_matter(metadata) + content
+            except TypeError:
+                front_matter = yaml.dump(metadata, Dumper=_YamlDumper,
+                                         default_flow_style=False, allow_unicode=True)
+                return f"---\n{front_matter}---\n\n{content}"
+
         return content
\ No newline at end of file